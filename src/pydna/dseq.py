@@ -16,10 +16,11 @@ The Dseq class support the notion of circular and linear DNA topology.
 
 
 import copy as _copy
-import itertools as _itertools
-import re as _re
+import functools as _functools
 import sys as _sys
 import math as _math
+import numpy as _np
+from collections.abc import Iterable as _Iterable
 
 from pydna.seq import Seq as _Seq
 from Bio.Seq import _translate_str
@@ -35,10 +36,39 @@ from pydna.utils import cuts_overlap as _cuts_overlap
 from pydna.common_sub_strings import common_sub_strings as _common_sub_strings
 from Bio.Restriction import RestrictionBatch as _RestrictionBatch
 from Bio.Restriction import CommOnly
+from Bio.Restriction.Restriction import RestrictionType as _RestrictionType
+from Bio.Restriction.Restriction import FormattedSeq as _FormattedSeq
 
 from typing import Tuple
 
 
+def _full_sequence(watson: str, crick: str, ovhg: int) -> bytes:
+    """The full sequence of a double stranded molecule as bytes.
+
+    This is the watson strand flanked by the complement of any single
+    stranded parts of the crick strand, see :attr:`Dseq.ovhg`.
+    """
+    right = len(crick) - ovhg - len(watson)
+    if ovhg > 0:
+        watson = _rc(crick[-ovhg:]) + watson
+    if right > 0:
+        watson = watson + _rc(crick[:right])
+    return bytes(watson, encoding="ASCII")
+
+
+@_functools.lru_cache(maxsize=64)
+def _polymerase_nucleotides(nucleotides: str) -> Tuple[str, str]:
+    """The nucleotides available to a DNA polymerase in both cases, and all
+    other ASCII characters.
+
+    Used by :meth:`Dseq.fill_in` and :meth:`Dseq.T4`, all nucleotides if none are given.
+    """
+    if not nucleotides:
+        nucleotides = "GATCRYWSMKHBVDN"
+    nucleotides = nucleotides.lower() + nucleotides.upper()
+    return nucleotides, "".join(chr(i) for i in range(128) if chr(i) not in nucleotides)
+
+
 class Dseq(_Seq):
     """Dseq holds information for a double stranded DNA fragment.
 
@@ -331,41 +361,7 @@ class Dseq(_Seq):
                     raise ValueError("More than one way of annealing the" " strands. Please provide ovhg value")
                 ovhg = T - F
 
-                sns = (ovhg * " ") + _pretty_str(watson)
-                asn = (-ovhg * " ") + _pretty_str(_rc(crick))
-
-                self._data = bytes(
-                    "".join([a.strip() or b.strip() for a, b in _itertools.zip_longest(sns, asn, fillvalue=" ")]),
-                    encoding="ASCII",
-                )
-
-            else:  # ovhg given
-                if ovhg == 0:
-                    if len(watson) == len(crick):
-                        self._data = bytes(watson, encoding="ASCII")
-                    elif len(watson) > len(crick):
-                        self._data = bytes(watson, encoding="ASCII")
-                    else:
-                        self._data = bytes(
-                            watson + _rc(crick[: len(crick) - len(watson)]),
-                            encoding="ASCII",
-                        )
-                elif ovhg > 0:
-                    if ovhg + len(watson) > len(crick):
-                        self._data = bytes(_rc(crick[-ovhg:]) + watson, encoding="ASCII")
-                    else:
-                        self._data = bytes(
-                            _rc(crick[-ovhg:]) + watson + _rc(crick[: len(crick) - ovhg - len(watson)]),
-                            encoding="ASCII",
-                        )
-                else:  # ovhg < 0
-                    if -ovhg + len(crick) > len(watson):
-                        self._data = bytes(
-                            watson + _rc(crick[: -ovhg + len(crick) - len(watson)]),
-                            encoding="ASCII",
-                        )
-                    else:
-                        self._data = bytes(watson, encoding="ASCII")
+            self._data = _full_sequence(watson, crick, ovhg)
 
         self.circular = circular
         self.watson = _pretty_str(watson)
@@ -384,15 +380,14 @@ class Dseq(_Seq):
         pos=0,
     ):
         obj = cls.__new__(cls)  # Does not call __init__
-        obj.watson = _pretty_str(watson)
-        obj.crick = _pretty_str(crick)
+        # pretty_str is immutable, so strands that already are one are shared, not copied
+        obj.watson = watson if type(watson) is _pretty_str else _pretty_str(watson)
+        obj.crick = crick if type(crick) is _pretty_str else _pretty_str(crick)
         obj.ovhg = ovhg
         obj.circular = circular
-        obj.length = max(len(watson) + max(0, ovhg), len(crick) + max(0, -ovhg))
+        obj._data = _full_sequence(watson, crick, ovhg)
+        obj.length = len(obj._data)
         obj.pos = pos
-        wb = bytes(watson, encoding="ASCII")
-        cb = bytes(crick, encoding="ASCII")
-        obj._data = _rc(cb[-max(0, ovhg) or len(cb) :]) + wb + _rc(cb[: max(0, len(cb) - ovhg - len(wb))])
         return obj
 
     @classmethod
@@ -424,11 +419,9 @@ class Dseq(_Seq):
         crick = obj.crick = _pretty_str(c.strip()[::-1])
         obj.circular = False
         # obj._linear = True
-        obj.length = max(len(watson) + max(0, ovhg), len(crick) + max(0, -ovhg))
+        obj._data = _full_sequence(watson, crick, ovhg)
+        obj.length = len(obj._data)
         obj.pos = 0
-        wb = bytes(watson, encoding="ASCII")
-        cb = bytes(crick, encoding="ASCII")
-        obj._data = _rc(cb[-max(0, ovhg) or len(cb) :]) + wb + _rc(cb[: max(0, len(cb) - ovhg - len(wb))])
         return obj
 
     @classmethod
@@ -476,7 +469,7 @@ class Dseq(_Seq):
           TTTT
 
         """
-        full_sequence_rev = str(Dseq(full_sequence).reverse_complement())
+        full_sequence_rev = _rc(full_sequence)
         watson = full_sequence
         crick = full_sequence_rev
 
@@ -492,7 +485,7 @@ class Dseq(_Seq):
         elif watson_ovhg > 0:
             crick = crick[watson_ovhg:]
 
-        return Dseq(watson, crick=crick, ovhg=crick_ovhg)
+        return Dseq.quick(watson, crick, ovhg=crick_ovhg)
 
     # @property
     # def ovhg(self):
@@ -521,16 +514,17 @@ class Dseq(_Seq):
                     (C x 289.2) + (G x 329.2) +
                     (N x 308.9) + 79.0
         """
-        nts = (self.watson + self.crick).lower()
-
-        return (
-            313.2 * nts.count("a")
-            + 304.2 * nts.count("t")
-            + 289.2 * nts.count("c")
-            + 329.2 * nts.count("g")
-            + 308.9 * nts.count("n")
-            + 79.0
-        )
+        nts = self.watson + self.crick
+        if len(nts) < 1000:
+            # str.count is faster for primers and short fragments
+            nts = nts.lower()
+            a, t, c, g, n = nts.count("a"), nts.count("t"), nts.count("c"), nts.count("g"), nts.count("n")
+        else:
+            # Setting bit 0x20 lowercases ASCII letters, so one count covers both cases
+            counts = _np.bincount(_np.frombuffer(bytes(nts, encoding="ASCII"), dtype=_np.uint8) | 0x20, minlength=256)
+            a, t, c, g, n = (int(counts[ord(nt)]) for nt in "atcgn")
+
+        return 313.2 * a + 304.2 * t + 289.2 * c + 329.2 * g + 308.9 * n + 79.0
 
     def upper(self):
         """Return an upper case copy of the sequence.
@@ -639,12 +633,41 @@ class Dseq(_Seq):
         if not self.circular:
             return _Seq.find(self, sub, start, end)
 
-        return (_pretty_str(self) + _pretty_str(self)).find(sub, start, end)
+        data = self._data
+        if start is None:
+            start = 0
+        if end is None:
+            end = _sys.maxsize
+        if 0 <= start < len(data) and end >= 0:
+            # A match at p >= len(self) + start is also found at p - len(self), so the
+            # sequence only has to be extended by start + len(sub) - 1 nucleotides
+            data += data[: max(0, start + len(sub) - 1)]
+        else:
+            data += data
+        return _Seq(data).find(sub, start, end)
 
     def __getitem__(self, sl):
         """Returns a subsequence. This method is used by the slice notation"""
 
-        if not self.circular:
+        if not self.circular and isinstance(sl, slice) and sl.step in (None, 1):
+            watson, crick, ovhg = self.watson, self.crick, self.ovhg
+            # Start of each strand in full sequence coordinates
+            w_off, c_off = (ovhg, 0) if ovhg > 0 else (0, -ovhg)
+            w_end, c_end = w_off + len(watson), c_off + len(crick)
+            start, stop, _ = sl.indices(w_end if w_end > c_end else c_end)
+            if stop < start:
+                stop = start
+            # Unpaired bases at the start of the slice on each strand
+            w_lead = w_off - start if w_off > start else 0
+            c_lead = c_off - start if c_off > start else 0
+            watson = watson[start + w_lead - w_off : stop - w_off if stop > w_off else 0]
+            crick = crick[c_end - stop if c_end > stop else 0 : c_end - start - c_lead if c_end > start else 0]
+            if not watson:
+                w_lead = stop - start
+            if not crick:
+                c_lead = stop - start
+            return Dseq.quick(watson, crick, w_lead if w_lead >= c_lead else -c_lead)
+        elif not self.circular:
             x = len(self.crick) - self.ovhg - len(self.watson)
 
             sns = (self.ovhg * " " + self.watson + x * " ")[sl]
@@ -652,7 +675,7 @@ class Dseq(_Seq):
 
             ovhg = max((len(sns) - len(sns.lstrip()), -len(asn) + len(asn.lstrip())), key=abs)
 
-            return Dseq(
+            return Dseq.quick(
                 sns.strip(),
                 asn[::-1].strip(),
                 ovhg=ovhg,
@@ -663,9 +686,13 @@ class Dseq(_Seq):
             if sl.start > len(self) or sl.stop > len(self):
                 return Dseq("")
             if sl.start < sl.stop:
-                return Dseq(
+                if sl.step in (None, 1) and sl.start >= 0:
+                    crick = self.crick[len(self) - sl.stop : len(self) - sl.start]
+                else:
+                    crick = self.crick[::-1][sl][::-1]
+                return Dseq.quick(
                     self.watson[sl],
-                    self.crick[::-1][sl][::-1],
+                    crick,
                     ovhg=0,
                     # linear=True
                 )
@@ -680,7 +707,7 @@ class Dseq(_Seq):
                 w = self.watson[(start or len(self)) :: stp] + self.watson[: (stop or 0) : stp]
                 c = self.crick[len(self) - stop :: stp] + self.crick[: len(self) - start : stp]
 
-                return Dseq(w, c, ovhg=0)  # , linear=True)
+                return Dseq.quick(w, c, ovhg=0)  # , linear=True)
 
     def __eq__(self, other):
         """Compare to another Dseq object OR an object that implements
@@ -689,94 +716,83 @@ class Dseq(_Seq):
 
         """
         try:
+            # Cheap integer tests first, lowercased copies only if the strands differ in case
             same = (
-                other.watson.lower() == self.watson.lower()
-                and other.crick.lower() == self.crick.lower()
-                and other.ovhg == self.ovhg
+                other.ovhg == self.ovhg
                 and self.circular == other.circular
+                and len(other.watson) == len(self.watson)
+                and len(other.crick) == len(self.crick)
+                and (other.watson == self.watson or other.watson.lower() == self.watson.lower())
+                and (other.crick == self.crick or other.crick.lower() == self.crick.lower())
             )
             # Also test for alphabet ?
         except AttributeError:
             same = False
         return same
 
+    def __hash__(self):
+        """__hash__ must be based on __eq__."""
+        return hash((self.watson.lower(), self.crick.lower(), self.ovhg, self.circular))
+
     def __repr__(self):
         """Returns a representation of the sequence, truncated if
         longer than 30 bp"""
 
-        if len(self) > Dseq.trunc:
-            if self.ovhg > 0:
-                d = self.crick[-self.ovhg :][::-1]
-                hej = len(d)
-                if len(d) > 10:
-                    d = "{}..{}".format(d[:4], d[-4:])
-                a = len(d) * " "
-
-            elif self.ovhg < 0:
-                a = self.watson[: max(0, -self.ovhg)]
-                hej = len(a)
-                if len(a) > 10:
-                    a = "{}..{}".format(a[:4], a[-4:])
-                d = len(a) * " "
-            else:
-                a = ""
-                d = ""
-                hej = 0
-
-            x = self.ovhg + len(self.watson) - len(self.crick)
-
-            if x > 0:
-                c = self.watson[len(self.crick) - self.ovhg :]
-                y = len(c)
-                if len(c) > 10:
-                    c = "{}..{}".format(c[:4], c[-4:])
-                f = len(c) * " "
-            elif x < 0:
-                f = self.crick[:-x][::-1]
-                y = len(f)
-                if len(f) > 10:
-                    f = "{}..{}".format(f[:4], f[-4:])
-                c = len(f) * " "
-            else:
-                c = ""
-                f = ""
-                y = 0
-
-            L = len(self) - hej - y
-            x1 = -min(0, self.ovhg)
-            x2 = x1 + L
-            x3 = -min(0, x)
-            x4 = x3 + L
-
-            b = self.watson[x1:x2]
-            e = self.crick[x3:x4][::-1]
-
-            if len(b) > 10:
-                b = "{}..{}".format(b[:4], b[-4:])
-                e = "{}..{}".format(e[:4], e[-4:])
-
-            return _pretty_str("{klass}({top}{size})\n" "{a}{b}{c}\n" "{d}{e}{f}").format(
-                klass=self.__class__.__name__,
-                top={False: "-", True: "o"}[self.circular],
-                size=len(self),
-                a=a,
-                b=b,
-                c=c,
-                d=d,
-                e=e,
-                f=f,
-            )
+        header = f"{self.__class__.__name__}({'o' if self.circular else '-'}{len(self)})"
 
+        if len(self) <= Dseq.trunc:
+            return _pretty_str(f"{header}\n{self.ovhg * ' '}{self.watson}\n{-self.ovhg * ' '}{self.crick[::-1]}")
+
+        if self.ovhg > 0:
+            d = self.crick[-self.ovhg :][::-1]
+            hej = len(d)
+            if len(d) > 10:
+                d = f"{d[:4]}..{d[-4:]}"
+            a = len(d) * " "
+        elif self.ovhg < 0:
+            a = self.watson[: max(0, -self.ovhg)]
+            hej = len(a)
+            if len(a) > 10:
+                a = f"{a[:4]}..{a[-4:]}"
+            d = len(a) * " "
         else:
-            return _pretty_str(
-                "{}({}{})\n{}\n{}".format(
-                    self.__class__.__name__,
-                    {False: "-", True: "o"}[self.circular],
-                    len(self),
-                    self.ovhg * " " + self.watson,
-                    -self.ovhg * " " + self.crick[::-1],
-                )
-            )
+            a = d = ""
+            hej = 0
+
+        x = self.ovhg + len(self.watson) - len(self.crick)
+
+        if x > 0:
+            c = self.watson[len(self.crick) - self.ovhg :]
+            y = len(c)
+            if len(c) > 10:
+                c = f"{c[:4]}..{c[-4:]}"
+            f = len(c) * " "
+        elif x < 0:
+            f = self.crick[:-x][::-1]
+            y = len(f)
+            if len(f) > 10:
+                f = f"{f[:4]}..{f[-4:]}"
+            c = len(f) * " "
+        else:
+            c = f = ""
+            y = 0
+
+        L = len(self) - hej - y
+        x1 = -min(0, self.ovhg)
+        x3 = -min(0, x)
+
+        # The double stranded middle part is usually long, only copy what is shown
+        lb = max(0, min(x1 + L, len(self.watson)) - x1)
+        le = max(0, min(x3 + L, len(self.crick)) - x3)
+
+        if lb > 10:
+            b = f"{self.watson[x1 : x1 + 4]}..{self.watson[x1 + lb - 4 : x1 + lb]}"
+            e = f"{self.crick[max(x3, x3 + le - 4) : x3 + le][::-1]}..{self.crick[x3 : x3 + min(4, le)][::-1]}"
+        else:
+            b = self.watson[x1 : x1 + lb]
+            e = self.crick[x3 : x3 + le][::-1]
+
+        return _pretty_str(f"{header}\n{a}{b}{c}\n{d}{e}{f}")
 
     def reverse_complement(self, inplace=False):
         """Dseq object where watson and crick have switched places.
@@ -862,10 +878,12 @@ class Dseq(_Seq):
             return self
         type5, sticky5 = self.five_prime_end()
         type3, sticky3 = self.three_prime_end()
-        if type5 == type3 and str(sticky5) == str(_rc(sticky3)):
+        if type5 == type3 and sticky5 == _rc(sticky3):
+            # With blunt ends the crick strand is used as is, slicing would copy it
+            crick = self.crick[-self.ovhg :] + self.crick[: -self.ovhg] if self.ovhg else self.crick
             nseq = Dseq.quick(
                 self.watson,
-                self.crick[-self.ovhg :] + self.crick[: -self.ovhg],
+                crick,
                 ovhg=0,
                 # linear=False,
                 circular=True,
@@ -1042,7 +1060,7 @@ class Dseq(_Seq):
         self_type, self_tail = self.three_prime_end()
         other_type, other_tail = other.five_prime_end()
 
-        if self_type == other_type and str(self_tail) == str(_rc(other_tail)):
+        if self_type == other_type and self_tail == _rc(other_tail):
             answer = Dseq.quick(self.watson + other.watson, other.crick + self.crick, self.ovhg)
         elif not self:
             answer = _copy.copy(other)
@@ -1057,32 +1075,59 @@ class Dseq(_Seq):
             raise TypeError("TypeError: can't multiply Dseq by non-int of type {}".format(type(number)))
         if number <= 0:
             return self.__class__("")
-        new = _copy.copy(self)
-        for i in range(number - 1):
-            new += self
-        return new
+        if number == 1:
+            return _copy.copy(self)
+        if abs(self.ovhg) >= len(self.watson):
+            # The strands do not overlap, so the ends change with every ligation
+            new = _copy.copy(self)
+            for i in range(number - 1):
+                new += self
+            return new
+        # The same compatibility tests as in __add__, done once for all copies
+        if self.circular:
+            raise TypeError("circular DNA cannot be ligated!")
+        self_type, self_tail = self.three_prime_end()
+        other_type, other_tail = self.five_prime_end()
+        if not (self_type == other_type and self_tail == _rc(other_tail)):
+            raise TypeError("sticky ends not compatible!")
+        return Dseq.quick(self.watson * number, self.crick * number, self.ovhg)
+
+    def _polymerase(self, nucleotides, chew_back):
+        """Strands and overhang after a DNA polymerase acts on both ends.
+
+        Five prime protruding ends are filled in as far as the given nucleotides
+        allow. With chew_back, the 3'-5' exonuclease activity also removes three
+        prime protruding ends and recesses both strands to the last of the given
+        nucleotides, as for T4 DNA polymerase.
+        """
+        nucleotides, others = _polymerase_nucleotides(nucleotides)
+        watson, crick, ovhg = self.watson, self.crick, self.ovhg
 
-    def _fill_in_five_prime(self, nucleotides):
-        stuffer = ""
         type, se = self.five_prime_end()
         if type == "5'":
-            for n in _rc(se):
-                if n in nucleotides:
-                    stuffer += n
-                else:
-                    break
-        return self.crick + stuffer, self.ovhg + len(stuffer)
+            # The longest prefix of the complement made up of the given nucleotides
+            stuffer = _rc(se)
+            stuffer = stuffer[: len(stuffer) - len(stuffer.lstrip(nucleotides))]
+            crick, ovhg = crick + stuffer, ovhg + len(stuffer)
+        elif type == "3'" and chew_back:
+            crick, ovhg = crick[: -len(se)], 0
 
-    def _fill_in_three_prime(self, nucleotides):
-        stuffer = ""
         type, se = self.three_prime_end()
         if type == "5'":
-            for n in _rc(se):
-                if n in nucleotides:
-                    stuffer += n
-                else:
-                    break
-        return self.watson + stuffer
+            stuffer = _rc(se)
+            stuffer = stuffer[: len(stuffer) - len(stuffer.lstrip(nucleotides))]
+            watson = watson + stuffer
+        elif type == "3'" and chew_back:
+            watson = watson[: -len(se)]
+
+        if chew_back:
+            # Chew back the 3' ends up to the last of the given nucleotides
+            chewed = crick.rstrip(others)
+            ovhg = len(chewed) - len(crick) + ovhg if chewed else 0
+            crick = chewed
+            watson = watson.rstrip(others)
+
+        return watson, crick, ovhg
 
     def fill_in(self, nucleotides=None):
         """Fill in of five prime protruding end with a DNA polymerase
@@ -1141,12 +1186,7 @@ class Dseq(_Seq):
         .. [#] http://en.wikipedia.org/wiki/Klenow_fragment#The_exo-_Klenow_fragment
 
         """
-        if not nucleotides:
-            nucleotides = "GATCRYWSMKHBVDN"
-        nucleotides = set(nucleotides.lower() + nucleotides.upper())
-        crick, ovhg = self._fill_in_five_prime(nucleotides)
-        watson = self._fill_in_three_prime(nucleotides)
-        return Dseq(watson, crick, ovhg)
+        return Dseq.quick(*self._polymerase(nucleotides, chew_back=False))
 
     def transcribe(self):
         return _Seq(self.watson).transcribe()
@@ -1195,7 +1235,12 @@ class Dseq(_Seq):
 
 
         """
-        return Dseq(self.watson[max(0, -self.ovhg) : min(len(self.watson), len(self.crick) - self.ovhg)])
+        watson, ovhg = self.watson, self.ovhg
+        start = -ovhg if ovhg < 0 else 0
+        stop = len(self.crick) - ovhg
+        if stop > len(watson):
+            stop = len(watson)
+        return Dseq.from_string(watson[start:stop])
 
     def T4(self, nucleotides=None):
         """Fill in five prime protruding ends and chewing back
@@ -1239,95 +1284,50 @@ class Dseq(_Seq):
 
         """
 
-        if not nucleotides:
-            nucleotides = "GATCRYWSMKHBVDN"
-        nucleotides = set(nucleotides.lower() + nucleotides.upper())
-        type, se = self.five_prime_end()
-        if type == "5'":
-            crick, ovhg = self._fill_in_five_prime(nucleotides)
-        else:
-            if type == "3'":
-                ovhg = 0
-                crick = self.crick[: -len(se)]
-            else:
-                ovhg = 0
-                crick = self.crick
-        x = len(crick) - 1
-        while x >= 0:
-            if crick[x] in nucleotides:
-                break
-            x -= 1
-        ovhg = x - len(crick) + 1 + ovhg
-        crick = crick[: x + 1]
-        if not crick:
-            ovhg = 0
-        watson = self.watson
-        type, se = self.three_prime_end()
-        if type == "5'":
-            watson = self._fill_in_three_prime(nucleotides)
-        else:
-            if type == "3'":
-                watson = self.watson[: -len(se)]
-        x = len(watson) - 1
-        while x >= 0:
-            if watson[x] in nucleotides:
-                break
-            x -= 1
-        watson = watson[: x + 1]
-        return Dseq(watson, crick, ovhg)
+        return Dseq.quick(*self._polymerase(nucleotides, chew_back=True))
 
     t4 = T4  # alias for the T4 method.
 
     def exo1_front(self, n=1):
         """5'-3' resection at the start (left side) of the molecule."""
-        d = _copy.deepcopy(self)
-        d.ovhg += n
-        d.watson = d.watson[n:]
-        return d
+        return Dseq.quick(self.watson[n:], self.crick, self.ovhg + n, self.circular, self.pos)
 
     def exo1_end(self, n=1):
         """5'-3' resection at the end (right side) of the molecule."""
-        d = _copy.deepcopy(self)
-        d.crick = d.crick[n:]
-        return d
+        return Dseq.quick(self.watson, self.crick[n:], self.ovhg, self.circular, self.pos)
 
-    def no_cutters(self, batch: _RestrictionBatch = None):
-        """Enzymes in a RestrictionBatch not cutting sequence."""
+    def _select_cutters(self, batch: _RestrictionBatch, condition) -> _RestrictionBatch:
+        """Enzymes in a RestrictionBatch with a number of cuts satisfying condition.
+
+        RestrictionBatch.search caches the last mapping, so repeated queries
+        with the same batch only scan the sequence once.
+        """
         if not batch:
             batch = CommOnly
         ana = batch.search(self)
-        ncut = {enz: sitelist for (enz, sitelist) in ana.items() if not sitelist}
-        return _RestrictionBatch(ncut)
+        return _RestrictionBatch({enz: sitelist for (enz, sitelist) in ana.items() if condition(len(sitelist))})
+
+    def no_cutters(self, batch: _RestrictionBatch = None):
+        """Enzymes in a RestrictionBatch not cutting sequence."""
+        return self._select_cutters(batch, lambda count: count == 0)
 
     def unique_cutters(self, batch: _RestrictionBatch = None):
         """Enzymes in a RestrictionBatch cutting sequence once."""
-        if not batch:
-            batch = CommOnly
         return self.n_cutters(n=1, batch=batch)
 
     once_cutters = unique_cutters  # alias for unique_cutters
 
     def twice_cutters(self, batch: _RestrictionBatch = None):
         """Enzymes in a RestrictionBatch cutting sequence twice."""
-        if not batch:
-            batch = CommOnly
         return self.n_cutters(n=2, batch=batch)
 
     def n_cutters(self, n=3, batch: _RestrictionBatch = None):
         """Enzymes in a RestrictionBatch cutting n times."""
-        if not batch:
-            batch = CommOnly
-        ana = batch.search(self)
-        ncut = {enz: sitelist for (enz, sitelist) in ana.items() if len(sitelist) == n}
-        return _RestrictionBatch(ncut)
+        return self._select_cutters(batch, lambda count: count == n)
 
     def cutters(self, batch: _RestrictionBatch = None):
         """Enzymes in a RestrictionBatch cutting sequence at least once."""
-        if not batch:
-            batch = CommOnly
-        ana = batch.search(self)
-        ncut = {enz: sitelist for (enz, sitelist) in ana.items() if sitelist}
-        return _RestrictionBatch(ncut)
+        return self._select_cutters(batch, lambda count: count > 0)
 
     def seguid(self):
         """SEGUID checksum for the sequence."""
@@ -1382,21 +1382,27 @@ class Dseq(_Seq):
 
     def cas9(self, RNA: str):
         """docstring."""
-        bRNA = bytes(RNA, "ASCII")
+        # The search ignores case, like the restriction enzyme searches
+        bRNA = bytes(RNA, "ASCII").upper()
         slices = []
-        cuts = [0]
-        for m in _re.finditer(bRNA, self._data):
-            cuts.append(m.start() + 17)
-        cuts.append(self.length)
-        slices = tuple(slice(x, y, 1) for x, y in zip(cuts, cuts[1:]))
-        return slices
+        start = 0
+        # Non overlapping matches, like re.finditer
+        find = self._data.upper().find
+        step = max(1, len(bRNA))
+        i = find(bRNA)
+        while i != -1:
+            slices.append(slice(start, i + 17, 1))
+            start = i + 17
+            i = find(bRNA, i + step)
+        slices.append(slice(start, self.length, 1))
+        return tuple(slices)
 
     def terminal_transferase(self, nucleotides="a"):
         """docstring."""
         ovhg = self.ovhg
         if self.ovhg >= 0:
             ovhg += len(nucleotides)
-        return Dseq(self.watson + nucleotides, self.crick + nucleotides, ovhg)
+        return Dseq.quick(self.watson + nucleotides, self.crick + nucleotides, ovhg)
 
     def cut(self, *enzymes):
         """Returns a list of linear Dseq fragments produced in the digestion.
@@ -1553,15 +1559,24 @@ class Dseq(_Seq):
         if len(enzymes) == 1 and isinstance(enzymes[0], _RestrictionBatch):
             # argument is probably a RestrictionBatch
             enzymes = [e for e in enzymes[0]]
+        elif any(isinstance(e, _Iterable) for e in enzymes):
+            # Nested lists, tuples or batches of enzymes
+            enzymes = _flatten(enzymes)
 
-        enzymes = _flatten(enzymes)
         out = list()
+        # Restriction enzymes search a translated copy of the sequence. Like in
+        # RestrictionBatch.search, it is made once and shared by all enzymes.
+        formatted = None
         for e in enzymes:
+            if isinstance(e, _RestrictionType):
+                if formatted is None:
+                    formatted = _FormattedSeq(self, linear=(not self.circular))
+                dna = formatted
+            else:
+                dna = self
             # Positions of the cut on the watson strand. They are 1-based, so we subtract
             # 1 to get 0-based positions
-            cuts_watson = [c - 1 for c in e.search(self, linear=(not self.circular))]
-
-            out += [((w, e.ovhg), e) for w in cuts_watson]
+            out.extend(((c - 1, e.ovhg), e) for c in e.search(dna, linear=(not self.circular)))
 
         return sorted([cutsite for cutsite in out if self.cutsite_is_valid(cutsite)])
 
@@ -1684,10 +1699,10 @@ class Dseq(_Seq):
 
         left_watson, left_crick, ovhg_left = self.get_cut_parameters(left_cut, True)
         right_watson, right_crick, _ = self.get_cut_parameters(right_cut, False)
-        return Dseq(
+        return Dseq.quick(
             str(self[left_watson:right_watson]),
             # The line below could be easier to understand as _rc(str(self[left_crick:right_crick])), but it does not preserve the case
-            str(self.reverse_complement()[len(self) - right_crick : len(self) - left_crick]),
+            str(self[left_crick:right_crick].reverse_complement()),
             ovhg=ovhg_left,
         )
 
@@ -1737,8 +1752,9 @@ class Dseq(_Seq):
         if not self.circular:
             cutsites = [None, *cutsites, None]
         else:
-            # Add the first cutsite at the end, for circular cuts
-            cutsites.append(cutsites[0])
+            # Add the first cutsite at the end, for circular cuts. The list passed
+            # in is not modified.
+            cutsites = [*cutsites, cutsites[0]]
 
         return list(zip(cutsites, cutsites[1:]))
 
@@ -84,6 +84,10 @@ def test_cas9():
 
     assert slice(0, 21, 1), slice(21, 27, 1) == s.cas9(RNA)
 
+    assert s.cas9(RNA) == (slice(0, 21, 1), slice(21, 27, 1))
+    assert s.cas9(RNA.upper()) == s.cas9(RNA)
+    assert Dseq("GATTCATGCATGTAGCTTACGTAGTCT").cas9(RNA) == s.cas9(RNA)
+
 
 def test_initialization():
     import pytest
@@ -101,6 +105,19 @@ def test_initialization():
     with pytest.raises(TypeError):
         obj * 2.3
 
+    sticky = Dseq("gatcaa", "gatctt", ovhg=-4)
+    assert sticky * 3 == sticky + sticky + sticky
+
+    # Strands that do not overlap
+    with pytest.raises(TypeError):
+        Dseq("ata", "tat", ovhg=-5) * 4
+
+    with pytest.raises(TypeError):
+        Dseq("aa", "ttgatc", ovhg=0) * 2
+
+    with pytest.raises(TypeError):
+        Dseq("aa", circular=True) * 2
+
     assert obj.seguid() == "ldseguid=ydezQsYTZgUCcb3-adxMaq_Xf8g"
 
     assert obj == Dseq("a", "t", circular=False)
@@ -277,6 +294,11 @@ def test_dseq():
 
     assert obj.looped() == obj
 
+    # Looping a blunt molecule shares the strands instead of copying them
+    blunt = Dseq("atg")
+    assert blunt.looped() == Dseq("atg", circular=True)
+    assert blunt.looped().crick is blunt.crick
+
     assert obj[:] == Dseq("atg", "cat", 0, circular=False)
 
     assert obj[1:2]._data == b"atg"[1:2]
@@ -509,6 +531,13 @@ def test_dseq():
     assert obj1.find("ggatcc") == -1
 
     assert obj1.find("tgtagta") == 9
+    assert obj1.find("ctatagcg") == 27
+    assert obj1.find("ctatagcg", 28) == -1
+    assert obj1.find("gctg", 9) == 37
+    assert Dseq("gatcgatcaa", circular=True).find("aag", None) == 8
+    assert Dseq("gatcgatcaa", circular=True).find("aag", 0, None) == 8
+    assert Dseq("gatcgatcaa", circular=True).find("aag", -3) == -1
+    assert Dseq("gatcgatcaa", circular=True).find("aag", -12) == 8
 
     assert Dseq("tagcgtagctgtagtatgtgatctggtcta", "tagaccagatcacatactacagctacgcta").looped() == obj1
 
@@ -614,6 +643,13 @@ def test_Dseq___getitem__():
     for shift in range(len(s)):
         assert str(s[shift:shift]) == str_seq[shift:] + str_seq[:shift]
 
+    # Negative indices on a circular molecule
+    d = Dseq("gatcGGa", circular=True)
+    assert d[-3:].watson == "GGa"
+    assert d[-3:].crick == "tCC"
+    assert d[-3:-1].watson == "GG"
+    assert d[-3:-1].crick == "CC"
+
 
 def test_cut_circular():
     from pydna.dseq import Dseq
@@ -641,6 +677,21 @@ def test_cut_circular():
         assert d == ()
 
 
+def test_eq_hash():
+    from pydna.dseq import Dseq
+
+    a = Dseq("gatcAAA", "tttGATC", ovhg=-4)
+    b = Dseq("GATCaaa", "TTTgatc", ovhg=-4)
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+    assert a != Dseq("gatcAAA", "tttGATC", ovhg=0)
+    assert Dseq("gatc") != Dseq("gatc", circular=True)
+    assert a != "gatcAAA"
+
+
 def test_repr():
     from pydna.dseq import Dseq
 
@@ -719,6 +770,31 @@ def test_shifted():
     assert a.shifted(0) is not a
 
 
+def test_exo1():
+    from pydna.dseq import Dseq
+
+    a = Dseq("gatcgatc")
+
+    b = a.exo1_front(2)
+    assert b == Dseq("tcgatc", a.crick, 2)
+    assert b.watson == "tcgatc"
+    assert b.crick == a.crick
+    assert str(b) == "gatcgatc"
+
+    c = a.exo1_end(3)
+    assert c.watson == a.watson
+    assert c.crick == "cgatc"
+    assert c.ovhg == 0
+    assert str(c) == "gatcgatc"
+
+    # Resecting a 5' overhang shortens the molecule
+    d = Dseq("aagatc", "gatc", ovhg=-2).exo1_front(2)
+    assert d.watson == "gatc"
+    assert d.ovhg == 0
+    assert str(d) == "gatc"
+    assert len(d) == 4
+
+
 def test_misc():
     from pydna.dseq import Dseq
 
@@ -1024,6 +1100,11 @@ def test_get_cutsite_pairs():
     # Two cuts on circular seq return 2 fragments
     assert dseq.get_cutsite_pairs([1, 2]) == [(1, 2), (2, 1)]
 
+    # The cutsites passed in are left untouched
+    cutsites = [1, 2]
+    dseq.get_cutsite_pairs(cutsites)
+    assert cutsites == [1, 2]
+
 
 def test_get_cut_parameters():
 